@@ -21,6 +21,16 @@ from components.roadmap import (
     get_all_tasks_dataframe,
     get_effort_icon
 )
+from components.validator import validate_data_files
+from components.portfolio import (
+    get_portfolio_shards,
+    get_shard_signature,
+    aggregate_portfolio_files,
+    get_portfolio_summary,
+    get_portfolio_category_scores,
+    get_portfolio_worst_gaps,
+    create_portfolio_score_histogram
+)
 
 # ── Page Configuration ──────────────────────────────────────────────
 st.set_page_config(
@@ -96,7 +106,22 @@ with st.sidebar:
     st.markdown("---")
     st.caption("Built for EU AI Act Compliance · Portfolio Project")
 
+# ── Validate Data ────────────────────────────────────────────────────
+validation_errors = validate_data_files()
+if validation_errors:
+    st.error("⚠️ **Invalid compliance data** — fix the errors below and reload the dashboard.")
+    for file_name, file_errors in validation_errors.items():
+        with st.expander(f"❌ {file_name} — {len(file_errors)} error(s)", expanded=True):
+            for error in file_errors:
+                st.markdown(f"- `{error}`")
+    st.stop()
+
 # ── Load Data ────────────────────────────────────────────────────────
+@st.cache_data(show_spinner="Aggregating AI portfolio...")
+def load_portfolio_aggregate(shard_signature):
+    """Aggregate the portfolio once per set of shard paths, mtimes and sizes"""
+    return aggregate_portfolio_files([path for path, _, _ in shard_signature])
+
 summary, metadata = get_summary_stats()
 df = get_compliance_dataframe()
 critical_gaps = get_critical_gaps()
@@ -144,6 +169,45 @@ if page == "📊 Executive Summary":
 
     st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
 
+    # Portfolio-wide view across all assessed AI systems
+    portfolio_shards = get_portfolio_shards()
+    if portfolio_shards:
+        st.markdown("### 🏢 AI Portfolio Overview")
+        portfolio_agg, portfolio_errors = load_portfolio_aggregate(get_shard_signature(portfolio_shards))
+        portfolio = get_portfolio_summary(portfolio_agg)
+
+        col1, col2, col3, col4, col5, col6 = st.columns(6)
+        with col1:
+            st.metric("AI Systems", portfolio["systems"])
+        with col2:
+            st.metric("Avg. Score", f"{portfolio['overall_score']}%")
+        with col3:
+            st.metric("Compliant Reqs", portfolio["compliant"])
+        with col4:
+            st.metric("Partial Reqs", portfolio["partial"])
+        with col5:
+            st.metric("Non-Compliant Reqs", portfolio["non_compliant"])
+        with col6:
+            st.metric("Critical Req Gaps", portfolio["critical_gaps"])
+        st.caption("Requirement counts are summed across every assessed AI system in the portfolio.")
+
+        if portfolio["systems"]:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("**Average Score by Category**")
+                st.dataframe(get_portfolio_category_scores(portfolio_agg), use_container_width=True)
+            with col2:
+                st.markdown("**Worst Gaps Across Portfolio**")
+                st.dataframe(get_portfolio_worst_gaps(portfolio_agg), use_container_width=True)
+            st.plotly_chart(create_portfolio_score_histogram(portfolio_agg), use_container_width=True)
+
+        for shard, shard_errors in portfolio_errors.items():
+            with st.expander(f"❌ {shard} — {len(shard_errors)} error(s); invalid systems left out of the totals"):
+                for error in shard_errors:
+                    st.markdown(f"- `{error}`")
+
+        st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+
     # Legal exposure warning
     st.error("""
     ⚠️ **Legal Exposure Warning**
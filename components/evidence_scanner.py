@@ -0,0 +1,197 @@
+import os
+import re
+import json
+import fnmatch
+import hashlib
+import warnings
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+CONFIG_PATH = "data/evidence_config.json"
+SCAN_RESULTS_PATH = "data/evidence_scan.json"
+REQUIREMENTS_PATH = "data/requirements.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def check_evidence_config(config, requirements):
+    """Return a list of problems with the scan roots and rule targets of a config"""
+    errors = []
+    roots = config.get("scan_roots")
+    if not isinstance(roots, list) or not all(isinstance(root, str) for root in roots):
+        errors.append("scan_roots must be a list of directory paths")
+    controls = {
+        (item["id"], control)
+        for item in requirements["requirements"]
+        for control in item["controls"]
+    }
+    for i, rule in enumerate(config.get("rules", [])):
+        if (rule.get("req_id"), rule.get("control")) not in controls:
+            errors.append(f"rules[{i}]: unknown control '{rule.get('control')}' for {rule.get('req_id')}")
+    return errors
+
+def load_evidence_config(path=CONFIG_PATH, requirements_path=REQUIREMENTS_PATH):
+    """Load the evidence scanner configuration and check it against requirements.json"""
+    with open(path, "r") as f:
+        config = json.load(f)
+    with open(requirements_path, "r") as f:
+        requirements = json.load(f)
+    errors = check_evidence_config(config, requirements)
+    if errors:
+        raise ValueError(f"Invalid evidence config {path}: " + "; ".join(errors))
+    return config
+
+def compile_rules(rules):
+    """Compile each rule's glob patterns into a single case-insensitive regex"""
+    compiled = []
+    for rule in rules:
+        pattern = "|".join(fnmatch.translate(p.lower()) for p in rule["patterns"])
+        compiled.append((re.compile(pattern), rule["req_id"], rule["control"]))
+    return compiled
+
+def match_rules(rel_path, compiled_rules):
+    """Return the (req_id, control) pairs whose patterns match a relative path"""
+    key = rel_path.lower()
+    return [(req_id, control) for regex, req_id, control in compiled_rules if regex.match(key)]
+
+def load_index(path):
+    """Load the previous scan index, or an empty one if none exists yet"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f).get("files", {})
+
+def save_index(path, files):
+    """Write the scan index atomically so an interrupted scan never corrupts it"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"files": files}, f)
+    os.replace(tmp_path, path)
+
+def hash_file(path):
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def scan_directory(path):
+    """Return (subdirectories, [(file_path, stat)]) for one directory, skipping entries that vanish"""
+    subdirs = []
+    files = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append((entry.path, entry.stat(follow_symlinks=False)))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return subdirs, files
+
+def _hash_or_none(path):
+    """Hash a file, returning None if it was deleted or became unreadable mid-scan"""
+    try:
+        return hash_file(path)
+    except OSError:
+        return None
+
+def _collect_candidates(pool, roots, compiled_rules):
+    """Walk every root in parallel, submitting each subdirectory to the pool as it is found"""
+    candidates = []
+    pending = {pool.submit(scan_directory, root): root for root in roots}
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            root = pending.pop(future)
+            subdirs, files = future.result()
+            for subdir in subdirs:
+                pending[pool.submit(scan_directory, subdir)] = root
+            for path, stat in files:
+                rel_path = os.path.relpath(path, root).replace(os.sep, "/")
+                matches = match_rules(rel_path, compiled_rules)
+                if matches:
+                    candidates.append((path, stat.st_mtime_ns, stat.st_size, matches))
+    return candidates
+
+def scan_evidence(config=None):
+    """Scan the configured evidence roots on a thread pool, rehashing only new or changed files"""
+    config = config or load_evidence_config()
+    compiled_rules = compile_rules(config["rules"])
+    index_path = config.get("index_path", "data/evidence_index.json")
+    previous = load_index(index_path)
+    max_workers = config.get("max_workers", 16)
+    for root in config["scan_roots"]:
+        if not os.path.isdir(root):
+            warnings.warn(f"Evidence root '{root}' does not exist; skipping")
+
+    files = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        candidates = _collect_candidates(pool, config["scan_roots"], compiled_rules)
+
+        to_hash = []
+        for path, mtime_ns, size, _ in candidates:
+            cached = previous.get(path)
+            if cached and cached["mtime_ns"] == mtime_ns and cached["size"] == size:
+                files[path] = cached
+            else:
+                to_hash.append((path, mtime_ns, size))
+
+        for (path, mtime_ns, size), digest in zip(to_hash, pool.map(_hash_or_none, [item[0] for item in to_hash])):
+            if digest is not None:
+                files[path] = {"mtime_ns": mtime_ns, "size": size, "sha256": digest}
+
+    save_index(index_path, files)
+
+    records = []
+    for path, _, _, matches in candidates:
+        if path not in files:
+            continue
+        for req_id, control in matches:
+            records.append({
+                "req_id": req_id,
+                "control": control,
+                "path": path,
+                "sha256": files[path]["sha256"]
+            })
+    return records
+
+def build_evidence_available(records):
+    """Group scan records into evidence_available entries keyed by req_id"""
+    evidence = {}
+    for record in sorted(records, key=lambda r: (r["req_id"], r["control"], r["path"])):
+        entry = f"{record['control']}: {record['path']} (sha256 {record['sha256'][:12]})"
+        evidence.setdefault(record["req_id"], []).append(entry)
+    return evidence
+
+def merge_evidence_available(compliance_scores, evidence):
+    """Return compliance scores with scanned evidence appended to evidence_available"""
+    merged = []
+    for item in compliance_scores:
+        existing = item["evidence_available"]
+        scanned = [e for e in evidence.get(item["req_id"], []) if e not in existing]
+        merged.append({**item, "evidence_available": existing + scanned})
+    return merged
+
+def save_scanned_evidence(evidence, path=SCAN_RESULTS_PATH):
+    """Write scanned evidence_available entries so the dashboard can merge them in"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(evidence, f, indent=2)
+    os.replace(tmp_path, path)
+
+def load_scanned_evidence(path=SCAN_RESULTS_PATH):
+    """Load the last scan's evidence_available entries, or none if no scan has run"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+if __name__ == "__main__":
+    evidence = build_evidence_available(scan_evidence())
+    save_scanned_evidence(evidence)
+    for req_id, entries in sorted(evidence.items()):
+        print(f"{req_id}: {len(entries)} evidence file(s)")
+    print(f"Wrote {SCAN_RESULTS_PATH}")
@@ -0,0 +1,248 @@
+import os
+import json
+import heapq
+import pandas as pd
+import plotly.graph_objects as go
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from components.risk_scorer import load_requirements
+from components.validator import get_requirement_ids, validate_system
+
+PORTFOLIO_DIR = "data/portfolio"
+HISTOGRAM_BUCKETS = 10
+TOP_K_GAPS = 10
+# JSON Lines shards are split into batches of roughly this size for the process pool
+BATCH_BYTES = 16 * 1024 * 1024
+
+def get_portfolio_shards(portfolio_dir=PORTFOLIO_DIR):
+    """Return the portfolio's .json (list of systems) and .jsonl (one system per line) shard files"""
+    if not os.path.isdir(portfolio_dir):
+        return []
+    return sorted(
+        os.path.join(portfolio_dir, name)
+        for name in os.listdir(portfolio_dir)
+        if name.endswith((".json", ".jsonl"))
+    )
+
+def get_shard_signature(paths):
+    """Return (path, mtime_ns, size) for each shard, used to detect changed portfolio data"""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+def split_shard(path, batch_bytes=BATCH_BYTES):
+    """Split a shard into (path, start, end) batches, cutting .jsonl shards at line boundaries"""
+    if not path.endswith(".jsonl"):
+        return [(path, None, None)]
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, "rb") as f:
+        while boundaries[-1] + batch_bytes < size:
+            f.seek(boundaries[-1] + batch_bytes)
+            f.readline()
+            if f.tell() >= size:
+                break
+            boundaries.append(f.tell())
+    boundaries.append(size)
+    return [(path, start, end) for start, end in zip(boundaries, boundaries[1:])]
+
+def empty_aggregate():
+    """Return the identity aggregate that every shard result merges into"""
+    return {
+        "systems": 0,
+        "overall_score_sum": 0.0,
+        "categories": {},
+        "severity_counts": {},
+        "status_counts": {},
+        "score_histogram": [0] * HISTOGRAM_BUCKETS,
+        "worst_gaps": []
+    }
+
+def aggregate_shard(systems, top_k=TOP_K_GAPS):
+    """Map step: compute partial sums, counts, histograms and top-k worst gaps for one shard"""
+    agg = empty_aggregate()
+    categories = agg["categories"]
+    severity_counts = agg["severity_counts"]
+    status_counts = agg["status_counts"]
+    histogram = agg["score_histogram"]
+    gaps = []
+
+    for system in systems:
+        agg["systems"] += 1
+        agg["overall_score_sum"] += system["summary"]["overall_score"]
+        system_name = system["assessment_metadata"]["system_name"]
+        for item in system["compliance_scores"]:
+            score = item["score"]
+            totals = categories.get(item["category"])
+            if totals is None:
+                categories[item["category"]] = [score, 1]
+            else:
+                totals[0] += score
+                totals[1] += 1
+            severity_counts[item["severity"]] = severity_counts.get(item["severity"], 0) + 1
+            status_counts[item["status"]] = status_counts.get(item["status"], 0) + 1
+            histogram[min(int(score * HISTOGRAM_BUCKETS // 100), HISTOGRAM_BUCKETS - 1)] += 1
+            gaps.append((score, system_name, item["req_id"], item["title"], item["severity"]))
+
+    agg["worst_gaps"] = heapq.nsmallest(top_k, gaps)
+    return agg
+
+def merge_aggregates(left, right, top_k=TOP_K_GAPS):
+    """Reduce step: combine two partial aggregates into one"""
+    categories = {name: list(totals) for name, totals in left["categories"].items()}
+    for name, (score_sum, count) in right["categories"].items():
+        totals = categories.setdefault(name, [0, 0])
+        totals[0] += score_sum
+        totals[1] += count
+
+    severity_counts = dict(left["severity_counts"])
+    for severity, count in right["severity_counts"].items():
+        severity_counts[severity] = severity_counts.get(severity, 0) + count
+
+    status_counts = dict(left["status_counts"])
+    for status, count in right["status_counts"].items():
+        status_counts[status] = status_counts.get(status, 0) + count
+
+    return {
+        "systems": left["systems"] + right["systems"],
+        "overall_score_sum": left["overall_score_sum"] + right["overall_score_sum"],
+        "categories": categories,
+        "severity_counts": severity_counts,
+        "status_counts": status_counts,
+        "score_histogram": [a + b for a, b in zip(left["score_histogram"], right["score_histogram"])],
+        "worst_gaps": heapq.nsmallest(top_k, left["worst_gaps"] + right["worst_gaps"])
+    }
+
+def _iter_batch(path, start, end, errors):
+    """Yield (error_prefix, system_path, system) for each parsable system in a batch"""
+    if start is None:
+        with open(path, "r") as f:
+            systems = json.load(f)
+        if not isinstance(systems, list):
+            errors.append(f"$: expected array, got {type(systems).__name__}")
+            return
+        for i, system in enumerate(systems):
+            yield "", (None, i), system
+        return
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    offset = start
+    for line in data.split(b"\n"):
+        prefix = f"byte {offset}: "
+        offset += len(line) + 1
+        if not line.strip():
+            continue
+        try:
+            system = json.loads(line)
+        except json.JSONDecodeError as e:
+            errors.append(f"{prefix}$: could not be parsed ({e})")
+            continue
+        yield prefix, None, system
+
+def aggregate_batch(batch):
+    """Load, validate and aggregate one shard batch, leaving out only the invalid systems"""
+    req_ids = get_requirement_ids(load_requirements())
+    systems = []
+    errors = []
+    try:
+        for prefix, path, system in _iter_batch(*batch, errors):
+            system_errors = []
+            validate_system(system, req_ids, path, system_errors)
+            if system_errors:
+                errors.extend(prefix + error for error in system_errors)
+            else:
+                systems.append(system)
+    except (OSError, json.JSONDecodeError) as e:
+        return [f"$: could not be loaded ({e})"], empty_aggregate()
+    return errors, aggregate_shard(systems)
+
+def aggregate_portfolio_files(paths, max_workers=None, batch_bytes=BATCH_BYTES):
+    """Map-reduce shard batches over a process pool, returning (aggregate, errors per shard)"""
+    batches = []
+    errors = {}
+    for path in paths:
+        try:
+            batches.extend(split_shard(path, batch_bytes))
+        except OSError as e:
+            errors[path] = [f"$: could not be loaded ({e})"]
+
+    max_workers = min(max_workers or os.cpu_count() or 1, max(len(batches), 1))
+    result = empty_aggregate()
+
+    def merge_partials(partials):
+        nonlocal result
+        for batch, (batch_errors, partial) in zip(batches, partials):
+            if batch_errors:
+                errors.setdefault(batch[0], []).extend(batch_errors)
+            result = merge_aggregates(result, partial)
+
+    if max_workers == 1:
+        merge_partials(map(aggregate_batch, batches))
+    else:
+        # Forking inside the multithreaded Streamlit server can deadlock, so always spawn
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=spawn) as pool:
+            merge_partials(pool.map(aggregate_batch, batches))
+    return result, errors
+
+def get_portfolio_summary(agg):
+    """Return portfolio-wide KPIs matching the single-system summary fields"""
+    systems = agg["systems"]
+    return {
+        "systems": systems,
+        "overall_score": round(agg["overall_score_sum"] / systems, 1) if systems else 0.0,
+        "compliant": agg["status_counts"].get("Compliant", 0),
+        "partial": agg["status_counts"].get("Partial", 0),
+        "non_compliant": agg["status_counts"].get("Non-Compliant", 0),
+        "critical_gaps": agg["severity_counts"].get("Critical", 0)
+    }
+
+def get_portfolio_category_scores(agg):
+    """Return average compliance score per category, shaped like calculate_category_scores"""
+    category_scores = pd.DataFrame([{
+        "category": name,
+        "avg_score": round(score_sum / count, 1)
+    } for name, (score_sum, count) in sorted(agg["categories"].items())])
+    return category_scores
+
+def get_portfolio_worst_gaps(agg):
+    """Return the lowest-scoring requirement gaps across the portfolio"""
+    return pd.DataFrame(
+        agg["worst_gaps"],
+        columns=["score", "system_name", "req_id", "title", "severity"]
+    )
+
+def create_portfolio_score_histogram(agg):
+    """Create a bar chart of requirement scores across the whole portfolio"""
+    width = 100 // HISTOGRAM_BUCKETS
+    labels = [f"{i * width}-{i * width + width - 1}%" for i in range(HISTOGRAM_BUCKETS)]
+    labels[-1] = f"{(HISTOGRAM_BUCKETS - 1) * width}-100%"
+    colors = [
+        "#FF4444" if i * width < 40 else "#FF8C00" if i * width < 70 else "#32CD32"
+        for i in range(HISTOGRAM_BUCKETS)
+    ]
+
+    fig = go.Figure(go.Bar(
+        x=labels,
+        y=agg["score_histogram"],
+        marker_color=colors,
+        hovertemplate="<b>%{x}</b><br>Requirements: %{y}<extra></extra>"
+    ))
+
+    fig.update_layout(
+        title="Requirement Score Distribution Across Portfolio",
+        xaxis_title="Compliance Score",
+        yaxis_title="Requirements",
+        height=350,
+        margin=dict(l=20, r=20, t=50, b=20),
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)"
+    )
+    return fig
\ No newline at end of file
@@ -1,10 +1,15 @@
 import json
 import pandas as pd
+from components.evidence_scanner import load_scanned_evidence, merge_evidence_available
 
 def load_gap_analysis():
-    """Load the gap analysis data from JSON file"""
+    """Load the gap analysis data from JSON file, merging in any scanned evidence"""
     with open("data/gap_analysis.json", "r") as f:
-        return json.load(f)
+        data = json.load(f)
+    data["compliance_scores"] = merge_evidence_available(
+        data["compliance_scores"], load_scanned_evidence()
+    )
+    return data
 
 def load_requirements():
     """Load the EU AI Act requirements from JSON file"""
@@ -3,6 +3,13 @@ import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 
+PHASE_DATES = {
+    1: ("2026-02-01", "2026-04-30"),
+    2: ("2026-05-01", "2026-07-31"),
+    3: ("2026-08-01", "2026-10-31"),
+    4: ("2026-11-01", "2027-02-28"),
+}
+
 def load_roadmap():
     """Load the roadmap data from JSON file"""
     with open("data/roadmap.json", "r") as f:
@@ -33,16 +40,9 @@ def create_gantt_chart():
     
     tasks = []
     
-    phase_dates = {
-        1: ("2026-02-01", "2026-04-30"),
-        2: ("2026-05-01", "2026-07-31"),
-        3: ("2026-08-01", "2026-10-31"),
-        4: ("2026-11-01", "2027-02-28"),
-    }
-    
     for phase in data["phases"]:
         phase_num = phase["phase_number"]
-        start_date, end_date = phase_dates[phase_num]
+        start_date, end_date = PHASE_DATES[phase_num]
         for task in phase["tasks"]:
             tasks.append({
                 "Task": task["title"],
@@ -0,0 +1,296 @@
+import os
+import json
+from components.roadmap import PHASE_DATES
+
+SEVERITIES = ["Critical", "High", "Medium", "Low"]
+STATUSES = ["Compliant", "Partial", "Non-Compliant"]
+EFFORTS = ["Low", "Medium", "High"]
+
+STRING = {"type": "string"}
+INTEGER = {"type": "integer"}
+NUMBER = {"type": "number"}
+PERCENTAGE = {"type": "number", "minimum": 0, "maximum": 100}
+STRING_LIST = {"type": "array", "items": STRING}
+
+REQUIREMENTS_SCHEMA = {
+    "type": "object",
+    "fields": {
+        "ai_system": {
+            "type": "object",
+            "fields": {"name": STRING, "classification": STRING}
+        },
+        "requirements": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "fields": {
+                    "id": STRING,
+                    "article": STRING,
+                    "title": STRING,
+                    "category": STRING,
+                    "mandatory": {"type": "boolean"},
+                    "controls": STRING_LIST
+                }
+            }
+        }
+    }
+}
+
+COMPLIANCE_SCORE_SCHEMA = {
+    "type": "object",
+    "fields": {
+        "req_id": STRING,
+        "title": STRING,
+        "category": STRING,
+        "article": STRING,
+        "score": PERCENTAGE,
+        "status": {"type": "string", "enum": STATUSES},
+        "severity": {"type": "string", "enum": SEVERITIES},
+        "findings": STRING_LIST,
+        "evidence_available": STRING_LIST,
+        "gap_description": STRING
+    }
+}
+
+GAP_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "fields": {
+        "assessment_metadata": {
+            "type": "object",
+            "fields": {"system_name": STRING, "assessment_date": STRING}
+        },
+        "compliance_scores": {"type": "array", "items": COMPLIANCE_SCORE_SCHEMA},
+        "summary": {
+            "type": "object",
+            "fields": {
+                "overall_score": PERCENTAGE,
+                "compliant": INTEGER,
+                "partial": INTEGER,
+                "non_compliant": INTEGER,
+                "critical_gaps": INTEGER
+            }
+        }
+    }
+}
+
+ROADMAP_SCHEMA = {
+    "type": "object",
+    "fields": {
+        "phases": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "fields": {
+                    "phase_number": INTEGER,
+                    "title": STRING,
+                    "duration": STRING,
+                    "priority": {"type": "string", "enum": SEVERITIES},
+                    "estimated_cost": STRING,
+                    "target_score_improvement": STRING,
+                    "description": STRING,
+                    "tasks": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "fields": {
+                                "id": STRING,
+                                "req_id": STRING,
+                                "title": STRING,
+                                "effort": {"type": "string", "enum": EFFORTS},
+                                "duration_weeks": NUMBER,
+                                "owner": STRING,
+                                "deliverable": STRING,
+                                "priority": {"type": "string", "enum": SEVERITIES}
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+PYTHON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool
+}
+
+def format_path(path):
+    """Render a (parent, key) path chain as a JSON path like $.phases[0].tasks[2]"""
+    parts = []
+    while path is not None:
+        path, key = path
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return "$" + "".join(reversed(parts))
+
+def compile_schema(spec):
+    """Compile a schema spec once into a single-pass checker function(value, path, errors)"""
+    kind = spec["type"]
+    expected = PYTHON_TYPES[kind]
+    # bool is a subclass of int, so numeric fields must reject it explicitly
+    reject_bool = kind in ("integer", "number")
+
+    def check_type(value, path, errors):
+        if not isinstance(value, expected) or (reject_bool and isinstance(value, bool)):
+            errors.append(f"{format_path(path)}: expected {kind}, got {type(value).__name__}")
+            return False
+        return True
+
+    if kind == "object":
+        fields = [(name, compile_schema(field)) for name, field in spec["fields"].items()]
+
+        def check(value, path, errors):
+            if not check_type(value, path, errors):
+                return
+            for name, check_field in fields:
+                if name in value:
+                    check_field(value[name], (path, name), errors)
+                else:
+                    errors.append(f"{format_path(path)}: missing required field '{name}'")
+        return check
+
+    if kind == "array":
+        check_item = compile_schema(spec["items"])
+
+        def check(value, path, errors):
+            if not check_type(value, path, errors):
+                return
+            for i, item in enumerate(value):
+                check_item(item, (path, i), errors)
+        return check
+
+    if "enum" in spec:
+        allowed = frozenset(spec["enum"])
+
+        def check(value, path, errors):
+            if check_type(value, path, errors) and value not in allowed:
+                errors.append(f"{format_path(path)}: '{value}' is not one of {spec['enum']}")
+        return check
+
+    if "minimum" in spec or "maximum" in spec:
+        minimum = spec.get("minimum", float("-inf"))
+        maximum = spec.get("maximum", float("inf"))
+
+        def check(value, path, errors):
+            if check_type(value, path, errors) and not minimum <= value <= maximum:
+                errors.append(f"{format_path(path)}: {value} is outside the range {minimum} to {maximum}")
+        return check
+
+    return check_type
+
+check_requirements = compile_schema(REQUIREMENTS_SCHEMA)
+check_gap_analysis = compile_schema(GAP_ANALYSIS_SCHEMA)
+check_roadmap = compile_schema(ROADMAP_SCHEMA)
+check_string_list = compile_schema(STRING_LIST)
+
+def get_requirement_ids(requirements):
+    """Return the set of requirement ids declared in requirements.json"""
+    items = requirements.get("requirements", []) if isinstance(requirements, dict) else []
+    return {item.get("id") for item in items if isinstance(item, dict)}
+
+def _check_gap_references(gap_analysis, req_ids, path, errors):
+    """Flag compliance scores that refer to requirements that do not exist"""
+    scores = gap_analysis.get("compliance_scores") if isinstance(gap_analysis, dict) else None
+    if not isinstance(scores, list):
+        return
+    scores_path = (path, "compliance_scores")
+    for i, item in enumerate(scores):
+        if isinstance(item, dict) and isinstance(item.get("req_id"), str) and item["req_id"] not in req_ids:
+            errors.append(f"{format_path(((scores_path, i), 'req_id'))}: unknown req_id '{item['req_id']}'")
+
+def _check_roadmap_references(roadmap, req_ids, errors):
+    """Flag roadmap tasks with unknown req_ids and phases with no Gantt dates"""
+    phases = roadmap.get("phases") if isinstance(roadmap, dict) else None
+    if not isinstance(phases, list):
+        return
+    phases_path = (None, "phases")
+    for i, phase in enumerate(phases):
+        if not isinstance(phase, dict):
+            continue
+        phase_path = (phases_path, i)
+        if isinstance(phase.get("phase_number"), int) and phase["phase_number"] not in PHASE_DATES:
+            errors.append(
+                f"{format_path((phase_path, 'phase_number'))}: no Gantt dates for phase {phase['phase_number']}"
+            )
+        tasks = phase.get("tasks")
+        if not isinstance(tasks, list):
+            continue
+        for j, task in enumerate(tasks):
+            if isinstance(task, dict) and isinstance(task.get("req_id"), str) and task["req_id"] not in req_ids:
+                errors.append(
+                    f"{format_path((((phase_path, 'tasks'), j), 'req_id'))}: unknown req_id '{task['req_id']}'"
+                )
+
+def validate_data(requirements, gap_analysis, roadmap):
+    """Validate the three data documents and return every error found, keyed by file"""
+    req_ids = get_requirement_ids(requirements)
+    errors = {"requirements.json": [], "gap_analysis.json": [], "roadmap.json": []}
+
+    check_requirements(requirements, None, errors["requirements.json"])
+    check_gap_analysis(gap_analysis, None, errors["gap_analysis.json"])
+    check_roadmap(roadmap, None, errors["roadmap.json"])
+
+    _check_gap_references(gap_analysis, req_ids, None, errors["gap_analysis.json"])
+    _check_roadmap_references(roadmap, req_ids, errors["roadmap.json"])
+
+    return {name: file_errors for name, file_errors in errors.items() if file_errors}
+
+def validate_system(system, req_ids, path, errors):
+    """Validate one gap analysis document and its req_id references"""
+    check_gap_analysis(system, path, errors)
+    _check_gap_references(system, req_ids, path, errors)
+
+def validate_portfolio(systems, requirements):
+    """Validate a portfolio batch: a list of gap analysis documents, one per AI system"""
+    errors = []
+    if not isinstance(systems, list):
+        return [f"$: expected array, got {type(systems).__name__}"]
+    req_ids = get_requirement_ids(requirements)
+    for i, system in enumerate(systems):
+        validate_system(system, req_ids, (None, i), errors)
+    return errors
+
+def validate_scanned_evidence(evidence, requirements):
+    """Validate evidence_scan.json: a mapping of known req_ids to lists of evidence strings"""
+    if not isinstance(evidence, dict):
+        return [f"$: expected object, got {type(evidence).__name__}"]
+    errors = []
+    req_ids = get_requirement_ids(requirements)
+    for req_id, entries in evidence.items():
+        if req_id not in req_ids:
+            errors.append(f"{format_path((None, req_id))}: unknown req_id '{req_id}'")
+        check_string_list(entries, (None, req_id), errors)
+    return errors
+
+def validate_data_files(data_dir="data"):
+    """Load and validate the data files, plus evidence_scan.json if a scan has been run"""
+    names = ["requirements.json", "gap_analysis.json", "roadmap.json"]
+    if os.path.exists(f"{data_dir}/evidence_scan.json"):
+        names.append("evidence_scan.json")
+
+    documents = {}
+    errors = {}
+    for name in names:
+        try:
+            with open(f"{data_dir}/{name}", "r") as f:
+                documents[name] = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            errors[name] = [f"$: could not be loaded ({e})"]
+            documents[name] = None
+    if errors:
+        return errors
+
+    errors = validate_data(
+        documents["requirements.json"],
+        documents["gap_analysis.json"],
+        documents["roadmap.json"]
+    )
+    if "evidence_scan.json" in documents:
+        scan_errors = validate_scanned_evidence(documents["evidence_scan.json"], documents["requirements.json"])
+        if scan_errors:
+            errors["evidence_scan.json"] = scan_errors
+    return errors
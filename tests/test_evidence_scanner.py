@@ -0,0 +1,94 @@
+import json
+import os
+import pytest
+import components.evidence_scanner as scanner
+
+RULES = [
+    {"req_id": "REQ-001", "control": "Documented risk management process", "patterns": ["*risk*policy*"]},
+    {"req_id": "REQ-003", "control": "Model cards and datasheets", "patterns": ["*model_card*"]}
+]
+
+@pytest.fixture
+def evidence_tree(tmp_path):
+    root = tmp_path / "evidence"
+    (root / "policies" / "nested").mkdir(parents=True)
+    (root / "policies" / "risk_policy.pdf").write_text("risk")
+    (root / "policies" / "nested" / "model_card.md").write_text("card")
+    (root / "policies" / "unrelated.txt").write_text("other")
+    config = {
+        "scan_roots": [str(root)],
+        "index_path": str(tmp_path / "index.json"),
+        "max_workers": 4,
+        "rules": RULES
+    }
+    return root, config
+
+def count_hashes(monkeypatch):
+    hashed = []
+    original = scanner.hash_file
+
+    def recording_hash(path):
+        hashed.append(os.path.basename(path))
+        return original(path)
+    monkeypatch.setattr(scanner, "hash_file", recording_hash)
+    return hashed
+
+def test_scan_maps_matching_files_to_controls(evidence_tree):
+    _, config = evidence_tree
+    evidence = scanner.build_evidence_available(scanner.scan_evidence(config))
+    assert sorted(evidence) == ["REQ-001", "REQ-003"]
+    assert evidence["REQ-003"][0].startswith("Model cards and datasheets: ")
+
+def test_rescan_only_rehashes_changed_files(evidence_tree, monkeypatch):
+    root, config = evidence_tree
+    hashed = count_hashes(monkeypatch)
+    scanner.scan_evidence(config)
+    assert sorted(hashed) == ["model_card.md", "risk_policy.pdf"]
+
+    hashed.clear()
+    scanner.scan_evidence(config)
+    assert hashed == []
+
+    (root / "policies" / "risk_policy.pdf").write_text("risk, revised")
+    scanner.scan_evidence(config)
+    assert hashed == ["risk_policy.pdf"]
+
+def test_vanishing_file_is_dropped_and_index_saved(evidence_tree, monkeypatch):
+    _, config = evidence_tree
+    original = scanner.hash_file
+
+    def flaky_hash(path):
+        if path.endswith("model_card.md"):
+            raise FileNotFoundError(path)
+        return original(path)
+    monkeypatch.setattr(scanner, "hash_file", flaky_hash)
+
+    records = scanner.scan_evidence(config)
+    assert [r["req_id"] for r in records] == ["REQ-001"]
+    with open(config["index_path"]) as f:
+        indexed = json.load(f)["files"]
+    assert [os.path.basename(p) for p in indexed] == ["risk_policy.pdf"]
+
+def test_missing_root_warns(evidence_tree, tmp_path):
+    _, config = evidence_tree
+    config["scan_roots"].append(str(tmp_path / "missing"))
+    with pytest.warns(UserWarning, match="does not exist"):
+        scanner.scan_evidence(config)
+
+def test_config_rejects_unknown_controls():
+    requirements = {"requirements": [{"id": "REQ-001", "controls": ["Documented risk management process"]}]}
+    config = {"scan_roots": "evidence", "rules": RULES}
+    errors = scanner.check_evidence_config(config, requirements)
+    assert errors == [
+        "scan_roots must be a list of directory paths",
+        "rules[1]: unknown control 'Model cards and datasheets' for REQ-003"
+    ]
+
+def test_shipped_config_matches_requirements():
+    assert scanner.load_evidence_config()["rules"]
+
+def test_merge_evidence_available_skips_duplicates():
+    scores = [{"req_id": "REQ-001", "evidence_available": ["a"]}]
+    merged = scanner.merge_evidence_available(scores, {"REQ-001": ["a", "b"]})
+    assert merged[0]["evidence_available"] == ["a", "b"]
+    assert scores[0]["evidence_available"] == ["a"]
@@ -0,0 +1,79 @@
+import copy
+import json
+import random
+import pytest
+from components.portfolio import (
+    aggregate_portfolio_files,
+    aggregate_shard,
+    empty_aggregate,
+    get_portfolio_summary,
+    merge_aggregates,
+    split_shard
+)
+
+def make_systems(count, seed=0):
+    with open("data/gap_analysis.json", "r") as f:
+        template = json.load(f)
+    rng = random.Random(seed)
+    systems = []
+    for i in range(count):
+        system = copy.deepcopy(template)
+        system["assessment_metadata"]["system_name"] = f"System {i}"
+        for item in system["compliance_scores"]:
+            item["score"] = rng.randint(0, 100)
+        systems.append(system)
+    return systems
+
+@pytest.fixture
+def shards(tmp_path):
+    systems = make_systems(200)
+    invalid = copy.deepcopy(systems[0])
+    invalid["compliance_scores"][0]["score"] = 250
+    lines = [json.dumps(s) for s in systems[:150]]
+    lines[40:40] = ["", "{bad", json.dumps(invalid)]
+    jsonl = tmp_path / "large.jsonl"
+    jsonl.write_text("\n".join(lines) + "\n")
+
+    json_shard = tmp_path / "small.json"
+    json_shard.write_text(json.dumps(systems[150:] + [invalid]))
+    return [str(jsonl), str(json_shard)]
+
+def test_merge_is_associative_and_matches_single_pass():
+    systems = make_systems(30)
+    a, b, c = aggregate_shard(systems[:7]), aggregate_shard(systems[7:19]), aggregate_shard(systems[19:])
+    left = merge_aggregates(merge_aggregates(a, b), c)
+    right = merge_aggregates(a, merge_aggregates(b, c))
+    assert left == right == merge_aggregates(empty_aggregate(), aggregate_shard(systems))
+
+def test_split_shard_cuts_at_line_boundaries(shards):
+    jsonl = shards[0]
+    batches = split_shard(jsonl, 4096)
+    assert len(batches) > 1
+    with open(jsonl, "rb") as f:
+        data = f.read()
+    assert batches[0][1] == 0 and batches[-1][2] == len(data)
+    for (_, _, end), (_, start, _) in zip(batches, batches[1:]):
+        assert end == start and data[start - 1:start] == b"\n"
+
+@pytest.mark.parametrize("batch_bytes", [1 << 30, 100 * 1024, 5 * 1024])
+def test_totals_do_not_depend_on_batch_size(shards, batch_bytes):
+    agg, errors = aggregate_portfolio_files(shards, max_workers=1, batch_bytes=batch_bytes)
+    expected = make_systems(200)
+
+    assert agg == merge_aggregates(empty_aggregate(), aggregate_shard(expected))
+    assert get_portfolio_summary(agg)["systems"] == 200
+    assert len(errors[shards[0]]) == 2
+    assert "could not be parsed" in errors[shards[0]][0]
+    assert errors[shards[1]] == ["$[50].compliance_scores[0].score: 250 is outside the range 0 to 100"]
+
+def test_process_pool_matches_serial(shards):
+    serial = aggregate_portfolio_files(shards, max_workers=1, batch_bytes=5 * 1024)
+    parallel = aggregate_portfolio_files(shards, max_workers=2, batch_bytes=5 * 1024)
+    assert parallel == serial
+
+def test_unreadable_shard_is_reported(tmp_path):
+    bad = tmp_path / "bad.json"
+    bad.write_text("{bad")
+    agg, errors = aggregate_portfolio_files([str(bad)], max_workers=1)
+    assert agg["systems"] == 0
+    assert errors[str(bad)][0].startswith("$: could not be loaded")
@@ -0,0 +1,84 @@
+import copy
+import json
+import pytest
+from components.validator import (
+    compile_schema,
+    validate_data,
+    validate_data_files,
+    validate_portfolio,
+    validate_scanned_evidence
+)
+
+def load(name):
+    with open(f"data/{name}", "r") as f:
+        return json.load(f)
+
+@pytest.fixture
+def documents():
+    return load("requirements.json"), load("gap_analysis.json"), load("roadmap.json")
+
+def test_shipped_data_is_valid():
+    assert validate_data_files() == {}
+
+def test_collects_every_error_with_json_paths(documents):
+    requirements, gap_analysis, roadmap = documents
+    del gap_analysis["compliance_scores"][1]["severity"]
+    gap_analysis["compliance_scores"][2]["score"] = "high"
+    gap_analysis["compliance_scores"][3]["req_id"] = "REQ-099"
+    roadmap["phases"][0]["tasks"][1]["req_id"] = "REQ-777"
+    roadmap["phases"][3]["phase_number"] = 5
+    requirements["requirements"][0]["mandatory"] = 1
+
+    assert validate_data(requirements, gap_analysis, roadmap) == {
+        "requirements.json": ["$.requirements[0].mandatory: expected boolean, got int"],
+        "gap_analysis.json": [
+            "$.compliance_scores[1]: missing required field 'severity'",
+            "$.compliance_scores[2].score: expected number, got str",
+            "$.compliance_scores[3].req_id: unknown req_id 'REQ-099'"
+        ],
+        "roadmap.json": [
+            "$.phases[0].tasks[1].req_id: unknown req_id 'REQ-777'",
+            "$.phases[3].phase_number: no Gantt dates for phase 5"
+        ]
+    }
+
+def test_scores_must_be_percentages(documents):
+    requirements, gap_analysis, _ = documents
+    gap_analysis["compliance_scores"][0]["score"] = -5
+    gap_analysis["summary"]["overall_score"] = 250
+    assert validate_portfolio([gap_analysis], requirements) == [
+        "$[0].compliance_scores[0].score: -5 is outside the range 0 to 100",
+        "$[0].summary.overall_score: 250 is outside the range 0 to 100"
+    ]
+
+def test_portfolio_reports_each_system_by_index(documents):
+    requirements, gap_analysis, _ = documents
+    broken = copy.deepcopy(gap_analysis)
+    broken["compliance_scores"][0]["status"] = "Unknown"
+    errors = validate_portfolio([gap_analysis, broken], requirements)
+    assert errors == [
+        "$[1].compliance_scores[0].status: 'Unknown' is not one of ['Compliant', 'Partial', 'Non-Compliant']"
+    ]
+
+def test_compiled_schema_rejects_bool_as_number():
+    errors = []
+    compile_schema({"type": "number"})(True, None, errors)
+    assert errors == ["$: expected number, got bool"]
+
+def test_scanned_evidence_must_map_known_requirements_to_strings(documents):
+    requirements = documents[0]
+    evidence = {"REQ-001": ["policy.pdf", 3], "REQ-099": "card.md"}
+    assert validate_scanned_evidence(evidence, requirements) == [
+        "$.REQ-001[1]: expected string, got int",
+        "$.REQ-099: unknown req_id 'REQ-099'",
+        "$.REQ-099: expected array, got str"
+    ]
+    assert validate_scanned_evidence([], requirements) == ["$: expected object, got list"]
+
+def test_unreadable_scan_file_is_reported(tmp_path):
+    for name in ["requirements.json", "gap_analysis.json", "roadmap.json"]:
+        (tmp_path / name).write_text(json.dumps(load(name)))
+    (tmp_path / "evidence_scan.json").write_text("{bad")
+    errors = validate_data_files(str(tmp_path))
+    assert list(errors) == ["evidence_scan.json"]
+    assert errors["evidence_scan.json"][0].startswith("$: could not be loaded")